@@ -2,20 +2,141 @@
 Command-line interface for X/Twitter Scraper.
 """
 
-import argparse
-import asyncio
 import logging
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 
 from .config import ScraperConfig, create_sample_config
-from .scraper import run_scraper
-from .session import interactive_login, verify_session
 from .logger import setup_logger
 
+# Heavy modules (asyncio, Playwright via .scraper/.session) are imported
+# lazily inside the branches that need them, so --help and --init-config
+# don't pay the Playwright import cost.
+
+
+# Option tables for the fast-path parser. Destinations and defaults must
+# stay in sync with the argparse definitions in _parse_args_argparse.
+_FLAG_OPTS = {
+    "--login": "login",
+    "--verify-session": "verify_session",
+    "--init-config": "init_config",
+    "--headless": "headless",
+    "--headful": "headful",
+    "--combined-only": "combined_only",
+    "--per-account-only": "per_account_only",
+    "--jsonl": "jsonl",
+    "--verbose": "verbose",
+    "-v": "verbose",
+    "--quiet": "quiet",
+    "-q": "quiet",
+}
+
+_VALUE_OPTS = {
+    "--config": "config",
+    "-c": "config",
+    "--accounts": "accounts",
+    "-a": "accounts",
+    "--out": "out",
+    "-o": "out",
+    "--limit": "limit",
+    "-n": "limit",
+    "--days": "days",
+    "--session": "session",
+    "--log-file": "log_file",
+}
+
+_INT_DESTS = {"limit", "days"}
+
+_ARG_DEFAULTS = {
+    "login": False,
+    "verify_session": False,
+    "init_config": False,
+    "config": None,
+    "accounts": None,
+    "out": None,
+    "limit": None,
+    "headless": None,
+    "headful": None,
+    "combined_only": False,
+    "per_account_only": False,
+    "jsonl": False,
+    "days": None,
+    "session": None,
+    "log_file": None,
+    "verbose": False,
+    "quiet": False,
+}
+
+
+def parse_args():
+    """
+    Parse command-line arguments.
+
+    The common case is handled by a small hand-rolled parser, so normal
+    invocations skip argparse's construction cost entirely. Anything the
+    fast path can't handle (--help, unknown flags, malformed values)
+    falls back to argparse for proper usage and error messages.
+    """
+    args = _parse_args_fast(sys.argv[1:])
+    if args is not None:
+        return args
+    return _parse_args_argparse()
+
+
+def _parse_args_fast(argv) -> "SimpleNamespace | None":
+    """
+    Parse known flags with a dict dispatch; return None to defer to argparse.
+    """
+    values = dict(_ARG_DEFAULTS)
+
+    i = 0
+    n = len(argv)
+    while i < n:
+        arg = argv[i]
+        if arg in ("-h", "--help"):
+            return None
+
+        name, eq, inline_value = arg.partition("=")
+
+        if name in _FLAG_OPTS:
+            if eq:
+                return None  # flags take no value
+            values[_FLAG_OPTS[name]] = True
+        elif name in _VALUE_OPTS:
+            if eq:
+                value = inline_value
+            else:
+                i += 1
+                if i >= n:
+                    return None  # missing value - let argparse report it
+                value = argv[i]
+
+            dest = _VALUE_OPTS[name]
+            if dest in _INT_DESTS:
+                try:
+                    value = int(value)
+                except ValueError:
+                    return None
+            values[dest] = value
+        else:
+            return None  # unknown option
+
+        i += 1
+
+    # The mode flags are mutually exclusive; argparse has the error message
+    if (values["login"] + values["verify_session"] + values["init_config"]) > 1:
+        return None
+    if values["combined_only"] and values["per_account_only"]:
+        return None
+
+    return SimpleNamespace(**values)
+
+
+def _parse_args_argparse():
+    """Full argparse parser - used for --help and error reporting."""
+    import argparse
 
-def parse_args() -> argparse.Namespace:
-    """Parse command-line arguments."""
     parser = argparse.ArgumentParser(
         prog="scrape",
         description="X/Twitter Scraper - Scrape posts from X.com profiles",
@@ -81,6 +202,24 @@ For more information, see the README.md file.
         help="Maximum posts to scrape per account (overrides config)"
     )
 
+    output_group = parser.add_mutually_exclusive_group()
+    output_group.add_argument(
+        "--combined-only",
+        action="store_true",
+        help="Only write the combined results files, skip per-account files"
+    )
+    output_group.add_argument(
+        "--per-account-only",
+        action="store_true",
+        help="Only write per-account files, skip the combined results files"
+    )
+
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Write end-of-run results as JSON-lines instead of JSON and CSV"
+    )
+
     # Browser settings
     parser.add_argument(
         "--headless",
@@ -135,7 +274,7 @@ For more information, see the README.md file.
     return parser.parse_args()
 
 
-def build_config(args: argparse.Namespace) -> ScraperConfig:
+def build_config(args) -> ScraperConfig:
     """
     Build ScraperConfig from command-line arguments.
 
@@ -162,6 +301,14 @@ def build_config(args: argparse.Namespace) -> ScraperConfig:
     if args.out:
         config.output_dir = args.out
 
+    if args.combined_only:
+        config.output_mode = "combined"
+    elif args.per_account_only:
+        config.output_mode = "per_account"
+
+    if args.jsonl:
+        config.output_format = "jsonl"
+
     if args.limit is not None:
         config.posts_per_account = args.limit
 
@@ -191,7 +338,16 @@ def main():
     """Main entry point for CLI."""
     args = parse_args()
 
-    # Determine log level
+    # Use uvloop's C event loop when available (POSIX only) - Playwright's
+    # driver is IPC-bound, so cheaper awaits add up over thousands of calls
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+
+    # Determine log level from flags
     if args.verbose:
         log_level = logging.DEBUG
     elif args.quiet:
@@ -199,12 +355,14 @@ def main():
     else:
         log_level = logging.INFO
 
-    # Set up logging
-    logger = setup_logger(
-        name="x_scraper",
-        log_file=args.log_file,
-        level=log_level
-    )
+    # Special modes don't read a config file - configure logging from
+    # the command line alone and handle them first
+    if args.init_config or args.login or args.verify_session:
+        logger = setup_logger(
+            name="x_scraper",
+            log_file=args.log_file,
+            level=log_level
+        )
 
     # Handle special modes
     if args.init_config:
@@ -214,6 +372,9 @@ def main():
         return
 
     if args.login:
+        import asyncio
+        from .session import interactive_login
+
         logger.info("Starting interactive login mode...")
         success = asyncio.run(interactive_login(args.session))
         if success:
@@ -224,6 +385,9 @@ def main():
             sys.exit(1)
 
     if args.verify_session:
+        import asyncio
+        from .session import verify_session
+
         logger.info("Verifying saved session...")
         valid = asyncio.run(verify_session(args.session))
         if valid:
@@ -236,6 +400,17 @@ def main():
     # Build configuration
     config = build_config(args)
 
+    # Merge logging settings from args and config, then set up the
+    # logger exactly once
+    if not args.verbose and not args.quiet:
+        log_level = getattr(logging, config.log_level.upper(), logging.INFO)
+
+    logger = setup_logger(
+        name="x_scraper",
+        log_file=args.log_file or config.log_file,
+        level=log_level
+    )
+
     # Validate we have accounts to scrape
     if not config.accounts:
         logger.error(
@@ -245,15 +420,10 @@ def main():
         logger.info("Run 'scrape --init-config' to create a sample config file.")
         sys.exit(1)
 
-    # Update logger with config settings
-    if config.log_file and not args.log_file:
-        setup_logger(
-            name="x_scraper",
-            log_file=config.log_file,
-            level=getattr(logging, config.log_level.upper(), logging.INFO)
-        )
-
     # Run the scraper
+    import asyncio
+    from .scraper import run_scraper
+
     try:
         result = asyncio.run(run_scraper(config))
 
@@ -8,6 +8,36 @@ from pathlib import Path
 from typing import List, Optional
 from datetime import datetime, timedelta
 
+# orjson parses/serializes several times faster than stdlib json;
+# fall back to stdlib if it isn't installed
+try:
+    import orjson
+
+    def _loads(data) -> dict:
+        return orjson.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    def _loads(data) -> dict:
+        return json.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
+# URL prefixes stripped by _normalize_account, already lowercased so the
+# comparison needs a single account.lower() per call
+_URL_PREFIXES = (
+    "https://x.com/",
+    "https://twitter.com/",
+    "http://x.com/",
+    "http://twitter.com/",
+    "x.com/",
+    "twitter.com/",
+)
+
 
 @dataclass
 class ScraperConfig:
@@ -19,9 +49,22 @@ class ScraperConfig:
     # Number of posts to scrape per account
     posts_per_account: int = 20
 
+    # Maximum accounts scraped concurrently (each gets its own page)
+    max_concurrency: int = 4
+
     # Output directory
     output_dir: str = "./data"
 
+    # Which end-of-run files to write: "both", "combined", or
+    # "per_account". Combined files duplicate every post's bytes, so
+    # large runs can halve output I/O by picking one side
+    output_mode: str = "both"
+
+    # End-of-run file format: "json" writes indented JSON plus CSV,
+    # "jsonl" writes compact JSON-lines only - the fast path when
+    # results feed other tools rather than spreadsheets
+    output_format: str = "json"
+
     # Optional date cutoff (days) - stop scraping when posts are older than this
     date_cutoff_days: Optional[int] = None
 
@@ -29,6 +72,10 @@ class ScraperConfig:
     headless: bool = False
     slow_mo: int = 50  # Milliseconds between actions
 
+    # Abort image/font/media/analytics requests - the data we extract
+    # lives in the DOM, so skipping the byte downloads is pure savings
+    block_resources: bool = True
+
     # Retry settings
     max_retries: int = 3
     retry_delay: float = 2.0  # Base delay in seconds (exponential backoff)
@@ -53,14 +100,17 @@ class ScraperConfig:
     # User agent (None = use browser default)
     user_agent: Optional[str] = None
 
+    # Seed for scroll/delay randomness (None = nondeterministic); set it
+    # to make run timing reproducible, e.g. for perf comparisons
+    random_seed: Optional[int] = None
+
     def __post_init__(self):
         """Validate and normalize configuration."""
-        # Normalize accounts - extract handles from URLs
+        # Normalize accounts - extract handles from URLs.
+        # The output directory is created by OutputHandler when the
+        # scraper actually writes, not on every config instantiation
         self.accounts = [self._normalize_account(acc) for acc in self.accounts]
 
-        # Ensure output directory exists
-        Path(self.output_dir).mkdir(parents=True, exist_ok=True)
-
     def _normalize_account(self, account: str) -> str:
         """
         Normalize account input to just the handle.
@@ -74,10 +124,9 @@ class ScraperConfig:
         account = account.strip()
 
         # Remove URL prefix
-        for prefix in ["https://x.com/", "https://twitter.com/",
-                       "http://x.com/", "http://twitter.com/",
-                       "x.com/", "twitter.com/"]:
-            if account.lower().startswith(prefix.lower()):
+        account_lower = account.lower()
+        for prefix in _URL_PREFIXES:
+            if account_lower.startswith(prefix):
                 account = account[len(prefix):]
                 break
 
@@ -100,12 +149,9 @@ class ScraperConfig:
     @classmethod
     def from_file(cls, config_path: str) -> "ScraperConfig":
         """Load configuration from a JSON file."""
-        path = Path(config_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Config file not found: {config_path}")
-
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        # Single buffered read; a missing file raises FileNotFoundError
+        # directly, so no separate exists() stat is needed
+        data = _loads(Path(config_path).read_bytes())
 
         return cls(**data)
 
@@ -119,10 +165,14 @@ class ScraperConfig:
         return {
             "accounts": self.accounts,
             "posts_per_account": self.posts_per_account,
+            "max_concurrency": self.max_concurrency,
             "output_dir": self.output_dir,
+            "output_mode": self.output_mode,
+            "output_format": self.output_format,
             "date_cutoff_days": self.date_cutoff_days,
             "headless": self.headless,
             "slow_mo": self.slow_mo,
+            "block_resources": self.block_resources,
             "max_retries": self.max_retries,
             "retry_delay": self.retry_delay,
             "scroll_delay_min": self.scroll_delay_min,
@@ -134,13 +184,13 @@ class ScraperConfig:
             "session_file": self.session_file,
             "log_file": self.log_file,
             "log_level": self.log_level,
-            "user_agent": self.user_agent
+            "user_agent": self.user_agent,
+            "random_seed": self.random_seed
         }
 
     def save(self, path: str):
         """Save configuration to a JSON file."""
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        Path(path).write_bytes(_dumps(self.to_dict()))
 
 
 def create_sample_config(path: str = "config.json"):
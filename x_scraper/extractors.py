@@ -8,15 +8,19 @@ to handle X's frequently changing DOM structure.
 import re
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from playwright.async_api import Locator, Page
 
 from .logger import get_logger
 
 logger = get_logger()
 
+# Precompiled URL patterns - extract_post_data runs these on every post
+_STATUS_RE = re.compile(r"/status/(\d+)")
+_HANDLE_RE = re.compile(r"x\.com/([^/]+)/status")
 
-@dataclass
+
+@dataclass(slots=True)
 class PostData:
     """Structured data for a single post/tweet."""
     account_handle: str = ""
@@ -36,7 +40,58 @@ class PostData:
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
-        return asdict(self)
+        # Explicit dict literal instead of dataclasses.asdict - asdict
+        # deep-copies every field and is ~10x slower, which matters when
+        # serializing thousands of posts
+        return {
+            "account_handle": self.account_handle,
+            "account_display_name": self.account_display_name,
+            "post_url": self.post_url,
+            "post_id": self.post_id,
+            "timestamp": self.timestamp,
+            "text_content": self.text_content,
+            "reply_count": self.reply_count,
+            "repost_count": self.repost_count,
+            "like_count": self.like_count,
+            "view_count": self.view_count,
+            "is_repost": self.is_repost,
+            "is_quote": self.is_quote,
+            "media_urls": list(self.media_urls),
+            "scraped_at": self.scraped_at,
+        }
+
+    @classmethod
+    def to_columns(cls, posts: List["PostData"]) -> Dict[str, list]:
+        """
+        Convert posts to a column-oriented dict of lists.
+
+        One pass produces a structure-of-arrays layout that columnar
+        writers (polars/pyarrow) ingest directly, without a per-row dict
+        per post. media_urls are joined into a single string, matching
+        the CSV output format.
+
+        Args:
+            posts: List of PostData objects
+
+        Returns:
+            Dictionary mapping field names to column lists
+        """
+        return {
+            "account_handle": [p.account_handle for p in posts],
+            "account_display_name": [p.account_display_name for p in posts],
+            "post_url": [p.post_url for p in posts],
+            "post_id": [p.post_id for p in posts],
+            "timestamp": [p.timestamp for p in posts],
+            "text_content": [p.text_content for p in posts],
+            "reply_count": [p.reply_count for p in posts],
+            "repost_count": [p.repost_count for p in posts],
+            "like_count": [p.like_count for p in posts],
+            "view_count": [p.view_count for p in posts],
+            "is_repost": [p.is_repost for p in posts],
+            "is_quote": [p.is_quote for p in posts],
+            "media_urls": ["; ".join(p.media_urls) for p in posts],
+            "scraped_at": [p.scraped_at for p in posts],
+        }
 
 
 # Selector strategies - multiple fallbacks for each element type
@@ -141,11 +196,155 @@ SELECTORS = {
     ],
 }
 
+# Playwright-only selector syntax that the browser's querySelector rejects;
+# these entries can't be part of a CSS union
+_NON_CSS_TOKENS = ("/.ancestor::", ":has-text(")
+
+
+def _css_union(selectors: List[str]) -> str:
+    """Join selector fallbacks into a single CSS union, dropping non-CSS entries."""
+    return ", ".join(
+        s for s in selectors
+        if not any(token in s for token in _NON_CSS_TOKENS)
+    )
+
+
+# Comma-joined unions so each fallback list is a single native browser query
+SELECTORS_UNIONS = {key: _css_union(sels) for key, sels in SELECTORS.items()}
+
+
+# Single in-page extraction function. Running one evaluate() per article
+# replaces the ~15 per-field locator round-trips that used to dominate
+# per-post wall time. The SELECTORS dict is passed in as the argument,
+# so the JS picks up selector changes automatically; entries that aren't
+# valid CSS (Playwright-only syntax) are skipped by the try/catch in q().
+EXTRACT_JS = """
+(article, selectors) => {
+    const q = (el, sels) => {
+        for (const sel of sels) {
+            try {
+                const found = el.querySelector(sel);
+                if (found) return found;
+            } catch (e) {
+                // Invalid selector for querySelector - skip
+            }
+        }
+        return null;
+    };
+    const text = (node) => node ? (node.textContent || "").trim() : "";
+    const attr = (node, name) => node ? (node.getAttribute(name) || "") : "";
+    const collect = (el, sels) => {
+        const srcs = [];
+        for (const sel of sels) {
+            try {
+                for (const node of el.querySelectorAll(sel)) {
+                    const src = node.getAttribute("src");
+                    if (src) srcs.push(src);
+                }
+            } catch (e) {
+                // Invalid selector - skip
+            }
+        }
+        return srcs;
+    };
+
+    return {
+        timestamp: attr(q(article, selectors.timestamp), "datetime"),
+        href: attr(q(article, selectors.permalink), "href"),
+        display_name: text(q(article, selectors.display_name)),
+        text: text(q(article, selectors.tweet_text)),
+        reply: text(q(article, selectors.reply_count)),
+        repost: text(q(article, selectors.repost_count)),
+        like: text(q(article, selectors.like_count)),
+        view: text(q(article, selectors.view_count)),
+        repost_context: text(q(article, selectors.repost_indicator)),
+        is_quote: q(article, selectors.quote_indicator) !== null,
+        images: collect(article, selectors.media_images),
+        videos: collect(article, selectors.media_videos),
+    };
+}
+"""
+
+
+# Page-level batch variant of EXTRACT_JS: one evaluation walks every
+# visible article, so a scroll pass costs a single round-trip instead of
+# one per article.
+BULK_EXTRACT_JS = """
+(selectors) => {
+    const q = (el, sels) => {
+        for (const sel of sels) {
+            try {
+                const found = el.querySelector(sel);
+                if (found) return found;
+            } catch (e) {
+                // Invalid selector for querySelector - skip
+            }
+        }
+        return null;
+    };
+    const text = (node) => node ? (node.textContent || "").trim() : "";
+    const attr = (node, name) => node ? (node.getAttribute(name) || "") : "";
+    const collect = (el, sels) => {
+        const srcs = [];
+        for (const sel of sels) {
+            try {
+                for (const node of el.querySelectorAll(sel)) {
+                    const src = node.getAttribute("src");
+                    if (src) srcs.push(src);
+                }
+            } catch (e) {
+                // Invalid selector - skip
+            }
+        }
+        return srcs;
+    };
+
+    let articles = [];
+    for (const sel of selectors.tweet_article) {
+        try {
+            const found = document.querySelectorAll(sel);
+            if (found.length > 0) {
+                articles = Array.from(found);
+                break;
+            }
+        } catch (e) {
+            // Invalid selector - skip
+        }
+    }
+
+    return articles.map((article) => ({
+        timestamp: attr(q(article, selectors.timestamp), "datetime"),
+        href: attr(q(article, selectors.permalink), "href"),
+        display_name: text(q(article, selectors.display_name)),
+        text: text(q(article, selectors.tweet_text)),
+        reply: text(q(article, selectors.reply_count)),
+        repost: text(q(article, selectors.repost_count)),
+        like: text(q(article, selectors.like_count)),
+        view: text(q(article, selectors.view_count)),
+        repost_context: text(q(article, selectors.repost_indicator)),
+        is_quote: q(article, selectors.quote_indicator) !== null,
+        images: collect(article, selectors.media_images),
+        videos: collect(article, selectors.media_videos),
+    }));
+}
+"""
+
+
+# Suffix multipliers for parse_count, keyed by the final character
+_COUNT_MULTIPLIERS = {
+    "K": 1000,
+    "M": 1000000,
+    "B": 1000000000,
+}
+
 
 def parse_count(text: str) -> int:
     """
     Parse engagement count strings like '1.5K', '2M', '500' to integers.
 
+    Dispatches on the last character instead of scanning for each suffix -
+    this runs four times per post, so it is worth keeping cheap.
+
     Args:
         text: Count string (e.g., "1.5K", "2M", "500")
 
@@ -155,28 +354,14 @@ def parse_count(text: str) -> int:
     if not text:
         return 0
 
-    text = text.strip().upper()
-
-    # Remove commas
-    text = text.replace(",", "")
-
-    # Handle suffixes
-    multipliers = {
-        "K": 1000,
-        "M": 1000000,
-        "B": 1000000000,
-    }
-
-    for suffix, multiplier in multipliers.items():
-        if suffix in text:
-            try:
-                num = float(text.replace(suffix, ""))
-                return int(num * multiplier)
-            except ValueError:
-                return 0
+    text = text.strip().replace(",", "")
+    if not text:
+        return 0
 
-    # Plain number
+    multiplier = _COUNT_MULTIPLIERS.get(text[-1].upper())
     try:
+        if multiplier:
+            return int(float(text[:-1]) * multiplier)
         return int(float(text))
     except ValueError:
         return 0
@@ -184,7 +369,11 @@ def parse_count(text: str) -> int:
 
 async def try_selectors(element: Locator, selectors: List[str]) -> Optional[Locator]:
     """
-    Try multiple selectors and return the first matching locator.
+    Match any of the given selector fallbacks and return a locator.
+
+    The fallbacks are collapsed into one comma-joined CSS union so the
+    browser evaluates them in a single query instead of one count()
+    round-trip per selector.
 
     Args:
         element: Parent element to search within
@@ -193,13 +382,15 @@ async def try_selectors(element: Locator, selectors: List[str]) -> Optional[Loca
     Returns:
         First matching locator or None
     """
-    for selector in selectors:
-        try:
-            loc = element.locator(selector).first
-            if await loc.count() > 0:
-                return loc
-        except Exception:
-            continue
+    union = _css_union(selectors)
+    if not union:
+        return None
+    try:
+        loc = element.locator(union).first
+        if await loc.count() > 0:
+            return loc
+    except Exception:
+        pass
     return None
 
 
@@ -232,7 +423,8 @@ async def get_attribute_safe(
 async def extract_post_data(
     article: Locator,
     target_handle: str,
-    page: Page
+    page: Page,
+    scraped_at: Optional[str] = None
 ) -> Optional[PostData]:
     """
     Extract all data from a single post/tweet article element.
@@ -241,114 +433,140 @@ async def extract_post_data(
         article: The article locator for the tweet
         target_handle: The handle of the account being scraped
         page: The page object for additional queries
+        scraped_at: ISO timestamp for the scrape batch. Callers processing
+            a batch of articles should compute this once and pass it in
 
     Returns:
         PostData object or None if extraction fails
     """
     try:
-        post = PostData(scraped_at=datetime.now().isoformat())
-
-        # Extract timestamp and post URL
-        time_elem = await try_selectors(article, SELECTORS["timestamp"])
-        if time_elem:
-            timestamp = await get_attribute_safe(time_elem, "datetime")
-            if timestamp:
-                post.timestamp = timestamp
-
-        # Extract permalink and post ID
-        permalink_elem = await try_selectors(article, SELECTORS["permalink"])
-        if permalink_elem:
-            href = await get_attribute_safe(permalink_elem, "href")
-            if href:
-                if href.startswith("/"):
-                    post.post_url = f"https://x.com{href}"
-                else:
-                    post.post_url = href
-
-                # Extract post ID from URL
-                match = re.search(r"/status/(\d+)", href)
-                if match:
-                    post.post_id = match.group(1)
+        # Pull all fields in a single in-page evaluation instead of one
+        # Playwright round-trip per field; evaluating on the locator
+        # skips the extra element_handle() hop
+        data = await article.evaluate(EXTRACT_JS, SELECTORS)
+    except Exception as e:
+        logger.debug(f"Error extracting post data: {e}")
+        return None
+
+    return build_post_data(data, target_handle, scraped_at)
+
+
+async def extract_visible_posts(
+    page: Page,
+    target_handle: str,
+    scraped_at: Optional[str] = None
+) -> List[PostData]:
+    """
+    Extract every visible post on the page in a single round-trip.
+
+    Runs BULK_EXTRACT_JS once against the whole page instead of one
+    evaluation per article, then assembles PostData objects in Python.
+
+    Args:
+        page: The page to extract from
+        target_handle: The handle of the account being scraped
+        scraped_at: ISO timestamp for the batch; defaults to now
+
+    Returns:
+        List of PostData objects, in page order (may be empty)
+    """
+    try:
+        raw = await page.evaluate(BULK_EXTRACT_JS, SELECTORS)
+    except Exception as e:
+        logger.debug(f"Bulk extraction failed: {e}")
+        return []
+
+    if scraped_at is None:
+        scraped_at = datetime.now().isoformat()
+
+    posts = []
+    for data in raw:
+        post = build_post_data(data, target_handle, scraped_at)
+        if post:
+            posts.append(post)
+    return posts
+
+
+def build_post_data(
+    data: Dict[str, Any],
+    target_handle: str,
+    scraped_at: Optional[str] = None
+) -> Optional[PostData]:
+    """
+    Assemble a PostData from the raw field dict returned by the in-page JS.
+
+    Args:
+        data: Field dict produced by EXTRACT_JS/BULK_EXTRACT_JS
+        target_handle: Fallback handle when none can be parsed from the URL
+        scraped_at: ISO timestamp for the scrape batch
+
+    Returns:
+        PostData object or None if the post has no usable content
+    """
+    try:
+        post = PostData(scraped_at=scraped_at or datetime.now().isoformat())
+
+        # Timestamp
+        if data.get("timestamp"):
+            post.timestamp = data["timestamp"]
+
+        # Permalink and post ID
+        href = data.get("href", "")
+        if href:
+            if href.startswith("/"):
+                post.post_url = f"https://x.com{href}"
+            else:
+                post.post_url = href
+
+            # Extract post ID from URL
+            match = _STATUS_RE.search(href)
+            if match:
+                post.post_id = match.group(1)
 
         # Extract handle from the post URL or user link
         if post.post_url:
-            match = re.search(r"x\.com/([^/]+)/status", post.post_url)
+            match = _HANDLE_RE.search(post.post_url)
             if match:
                 post.account_handle = match.group(1)
 
         if not post.account_handle:
             post.account_handle = target_handle
 
-        # Extract display name
-        display_name_elem = await try_selectors(article, SELECTORS["display_name"])
-        post.account_display_name = await get_text_safe(display_name_elem)
-
-        # Extract tweet text
-        text_elem = await try_selectors(article, SELECTORS["tweet_text"])
-        post.text_content = await get_text_safe(text_elem)
-
-        # Extract engagement counts
-        # Reply count
-        reply_elem = await try_selectors(article, SELECTORS["reply_count"])
-        reply_text = await get_text_safe(reply_elem)
-        post.reply_count = parse_count(reply_text)
-
-        # Repost count
-        repost_elem = await try_selectors(article, SELECTORS["repost_count"])
-        repost_text = await get_text_safe(repost_elem)
-        post.repost_count = parse_count(repost_text)
-
-        # Like count
-        like_elem = await try_selectors(article, SELECTORS["like_count"])
-        like_text = await get_text_safe(like_elem)
-        post.like_count = parse_count(like_text)
-
-        # View count
-        view_elem = await try_selectors(article, SELECTORS["view_count"])
-        view_text = await get_text_safe(view_elem)
-        post.view_count = parse_count(view_text)
+        # Display name and tweet text
+        post.account_display_name = data.get("display_name", "")
+        post.text_content = data.get("text", "")
 
-        # Check if repost
-        repost_indicator = await try_selectors(article, SELECTORS["repost_indicator"])
-        if repost_indicator:
-            indicator_text = await get_text_safe(repost_indicator)
-            post.is_repost = "repost" in indicator_text.lower()
+        # Engagement counts
+        post.reply_count = parse_count(data.get("reply", ""))
+        post.repost_count = parse_count(data.get("repost", ""))
+        post.like_count = parse_count(data.get("like", ""))
+        post.view_count = parse_count(data.get("view", ""))
 
-        # Check if quote tweet
-        quote_indicator = await try_selectors(article, SELECTORS["quote_indicator"])
-        post.is_quote = quote_indicator is not None and await quote_indicator.count() > 0
+        # Repost/quote indicators
+        indicator_text = data.get("repost_context", "")
+        post.is_repost = "repost" in indicator_text.lower()
+        post.is_quote = bool(data.get("is_quote"))
 
-        # Extract media URLs
-        media_urls = []
+        # Extract media URLs - set-based dedup, list keeps insertion order
+        media_urls: List[str] = []
+        seen_media: set = set()
 
         # Images
-        for selector in SELECTORS["media_images"]:
-            try:
-                images = article.locator(selector)
-                count = await images.count()
-                for i in range(count):
-                    src = await images.nth(i).get_attribute("src", timeout=1000)
-                    if src and "pbs.twimg.com" in src:
-                        # Get highest quality version
-                        if "?" in src:
-                            src = src.split("?")[0]
-                        src = f"{src}?format=jpg&name=large"
-                        if src not in media_urls:
-                            media_urls.append(src)
-            except Exception:
-                continue
+        for src in data.get("images", []):
+            if src and "pbs.twimg.com" in src:
+                # Get highest quality version
+                if "?" in src:
+                    src = src.split("?")[0]
+                src = f"{src}?format=jpg&name=large"
+                if src not in seen_media:
+                    seen_media.add(src)
+                    media_urls.append(src)
 
         # Videos (get poster/thumbnail at minimum)
-        for selector in SELECTORS["media_videos"]:
-            try:
-                videos = article.locator(selector)
-                count = await videos.count()
-                for i in range(count):
-                    src = await videos.nth(i).get_attribute("src", timeout=1000)
-                    if src and src not in media_urls:
-                        media_urls.append(src)
-            except Exception:
-                continue
+        for src in data.get("videos", []):
+            if src and src not in seen_media:
+                seen_media.add(src)
+                media_urls.append(src)
 
         post.media_urls = media_urls
 
@@ -360,7 +578,7 @@ async def extract_post_data(
         return post
 
     except Exception as e:
-        logger.debug(f"Error extracting post data: {e}")
+        logger.debug(f"Error building post data: {e}")
         return None
 
 
@@ -374,17 +592,18 @@ def parse_twitter_timestamp(timestamp_str: str) -> Optional[datetime]:
     Returns:
         datetime object or None
     """
-    if not timestamp_str:
+    if not timestamp_str or "T" not in timestamp_str:
         return None
 
-    try:
-        # ISO format (most common from time[datetime] attribute)
-        if "T" in timestamp_str:
-            return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-    except Exception:
-        pass
+    # ISO format (most common from time[datetime] attribute); the common
+    # trailing Z is swapped by slicing rather than a full replace() scan
+    if timestamp_str.endswith("Z"):
+        timestamp_str = timestamp_str[:-1] + "+00:00"
 
-    return None
+    try:
+        return datetime.fromisoformat(timestamp_str)
+    except ValueError:
+        return None
 
 
 def is_post_within_cutoff(post: PostData, cutoff_date: Optional[datetime]) -> bool:
@@ -409,8 +628,13 @@ def is_post_within_cutoff(post: PostData, cutoff_date: Optional[datetime]) -> bo
     if post_date is None:
         return True
 
-    # Remove timezone info for comparison if needed
-    if post_date.tzinfo is not None:
-        post_date = post_date.replace(tzinfo=None)
+    # Compare both sides timezone-aware: post timestamps are UTC-aware,
+    # while the cutoff from get_cutoff_date() is naive local time.
+    # Stripping tzinfo here used to shift the comparison by the local
+    # UTC offset
+    if post_date.tzinfo is None:
+        post_date = post_date.astimezone()
+    if cutoff_date.tzinfo is None:
+        cutoff_date = cutoff_date.astimezone()
 
     return post_date >= cutoff_date
@@ -29,8 +29,23 @@ def setup_logger(
     """
     logger = logging.getLogger(name)
 
-    # Prevent duplicate handlers if logger already exists
+    # Already configured: sync levels and attach the requested log file
+    # if it isn't present yet, instead of stacking duplicate handlers
     if logger.handlers:
+        logger.setLevel(level)
+        for handler in logger.handlers:
+            handler.setLevel(level)
+
+        if log_file:
+            log_file_path = _resolve_log_path(log_file, log_dir)
+            has_file_handler = any(
+                isinstance(h, logging.FileHandler)
+                and Path(h.baseFilename) == log_file_path.absolute()
+                for h in logger.handlers
+            )
+            if not has_file_handler:
+                _attach_file_handler(logger, log_file_path, level)
+
         return logger
 
     logger.setLevel(level)
@@ -47,27 +62,40 @@ def setup_logger(
 
     # File handler (optional)
     if log_file:
-        if log_dir:
-            log_path = Path(log_dir)
-            log_path.mkdir(parents=True, exist_ok=True)
-            log_file_path = log_path / log_file
-        else:
-            log_file_path = Path(log_file)
-            log_file_path.parent.mkdir(parents=True, exist_ok=True)
-
-        file_handler = logging.FileHandler(log_file_path, encoding="utf-8")
-        file_handler.setLevel(level)
-        file_format = logging.Formatter(
-            "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
-        file_handler.setFormatter(file_format)
-        logger.addHandler(file_handler)
-        logger.info(f"Logging to file: {log_file_path}")
+        _attach_file_handler(logger, _resolve_log_path(log_file, log_dir), level)
 
     return logger
 
 
+def _resolve_log_path(log_file: str, log_dir: Optional[str]) -> Path:
+    """Resolve the log file path, creating its directory if needed."""
+    if log_dir:
+        log_path = Path(log_dir)
+        log_path.mkdir(parents=True, exist_ok=True)
+        return log_path / log_file
+
+    log_file_path = Path(log_file)
+    log_file_path.parent.mkdir(parents=True, exist_ok=True)
+    return log_file_path
+
+
+def _attach_file_handler(
+    logger: logging.Logger,
+    log_file_path: Path,
+    level: int
+):
+    """Attach a file handler to the logger."""
+    file_handler = logging.FileHandler(log_file_path, encoding="utf-8")
+    file_handler.setLevel(level)
+    file_format = logging.Formatter(
+        "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
+    file_handler.setFormatter(file_format)
+    logger.addHandler(file_handler)
+    logger.info(f"Logging to file: {log_file_path}")
+
+
 def get_logger(name: str = "x_scraper") -> logging.Logger:
     """Get an existing logger or create a basic one."""
     logger = logging.getLogger(name)
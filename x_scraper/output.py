@@ -6,7 +6,23 @@ Handles saving scraped data to JSON and CSV formats.
 
 import json
 import csv
+import re
+from itertools import chain
 from pathlib import Path
+
+# orjson serializes several times faster than stdlib json and skips the
+# ensure_ascii escape pass; fall back to stdlib if it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# polars' Rust CSV writer is an order of magnitude faster than
+# csv.DictWriter on large combined files; optional, like orjson
+try:
+    import polars as pl
+except ImportError:
+    pl = None
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
@@ -15,6 +31,9 @@ from .logger import get_logger
 
 logger = get_logger()
 
+# Characters stripped from handles when building filenames
+_UNSAFE_FILENAME_RE = re.compile(r"[^A-Za-z0-9_-]")
+
 
 class OutputHandler:
     """Handle saving scraped data to various formats."""
@@ -29,6 +48,112 @@ class OutputHandler:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Open NDJSON streams, keyed by account handle
+        self._ndjson_files: Dict[str, Any] = {}
+
+    def stream_post(self, post: PostData, handle: str) -> None:
+        """
+        Append a single post to the per-account NDJSON stream.
+
+        Posts are written as they are scraped, one JSON object per line,
+        so memory stays constant and partial results survive interruption.
+        The file is opened in append mode: it accumulates across runs,
+        which is what lets incremental runs stop at last run's newest
+        post without losing the history that justifies stopping.
+
+        Args:
+            post: PostData object to append
+            handle: Account handle the post belongs to
+        """
+        f = self._ndjson_files.get(handle)
+        if f is None:
+            safe_handle = _UNSAFE_FILENAME_RE.sub("", handle)
+            filepath = self.output_dir / f"{safe_handle}.ndjson"
+            f = open(filepath, "a", encoding="utf-8")
+            self._ndjson_files[handle] = f
+
+        if orjson is not None:
+            line = orjson.dumps(post.to_dict()).decode("utf-8")
+        else:
+            line = json.dumps(post.to_dict(), separators=(",", ":"), ensure_ascii=False)
+        f.write(line)
+        f.write("\n")
+
+    def _load_ndjson(self, handle: str) -> List[Dict[str, Any]]:
+        """
+        Load the cumulative NDJSON history for an account.
+
+        The stream file is append-only across runs, so it holds every
+        post ever scraped for the handle. Duplicate post_ids (possible
+        after a run interrupted before the scrape cache was saved) keep
+        the newest record; a torn final line is skipped.
+
+        Args:
+            handle: Account handle
+
+        Returns:
+            List of post dicts, deduplicated by post_id
+        """
+        safe_handle = _UNSAFE_FILENAME_RE.sub("", handle)
+        filepath = self.output_dir / f"{safe_handle}.ndjson"
+        records: Dict[Any, Dict[str, Any]] = {}
+        try:
+            with open(filepath, "rb") as f:
+                for line_no, line in enumerate(f):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = (
+                            orjson.loads(line) if orjson is not None
+                            else json.loads(line)
+                        )
+                    except ValueError:
+                        continue
+                    records[record.get("post_id") or line_no] = record
+        except OSError:
+            return []
+        return list(records.values())
+
+    def close_streams(self) -> None:
+        """Close any open NDJSON streams."""
+        for handle, f in self._ndjson_files.items():
+            try:
+                f.close()
+            except Exception as e:
+                logger.debug(f"Error closing NDJSON stream for @{handle}: {e}")
+        self._ndjson_files.clear()
+
+    def save_jsonl(self, posts, filename: str) -> str:
+        """
+        Save posts to a JSON-lines file in one streaming pass.
+
+        One compact JSON object per line - no indentation pass and no
+        whole-list serialization buffer, so memory stays flat no matter
+        how many posts there are.
+
+        Args:
+            posts: Iterable of PostData objects or dicts
+            filename: Output filename (without path)
+
+        Returns:
+            Full path to saved file
+        """
+        filepath = self.output_dir / filename
+        with open(filepath, "wb", buffering=1 << 20) as f:
+            for post in posts:
+                record = post.to_dict() if isinstance(post, PostData) else post
+                if orjson is not None:
+                    f.write(orjson.dumps(record, default=str))
+                else:
+                    f.write(json.dumps(
+                        record, separators=(",", ":"),
+                        ensure_ascii=False, default=str
+                    ).encode("utf-8"))
+                f.write(b"\n")
+        logger.info(f"Saved JSONL: {filepath}")
+        return str(filepath)
+
     def save_json(self, data: List[Dict[str, Any]], filename: str) -> str:
         """
         Save data to JSON file.
@@ -41,8 +166,15 @@ class OutputHandler:
             Full path to saved file
         """
         filepath = self.output_dir / filename
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        if orjson is not None:
+            # Serialize in one native pass and write bytes directly -
+            # no Python-level traversal or UTF-8 re-encoding
+            filepath.write_bytes(
+                orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str)
+            )
+        else:
+            with open(filepath, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
         logger.info(f"Saved JSON: {filepath}")
         return str(filepath)
 
@@ -60,32 +192,75 @@ class OutputHandler:
         if not data:
             logger.warning(f"No data to save to CSV: {filename}")
             filepath = self.output_dir / filename
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write("")
+            filepath.touch()
             return str(filepath)
 
         filepath = self.output_dir / filename
 
-        # Get all unique fields from all records
+        # Convert list fields to string for CSV
+        rows = [
+            {
+                key: "; ".join(map(str, value)) if isinstance(value, list) else value
+                for key, value in record.items()
+            }
+            for record in data
+        ]
+
+        # Fast path: let polars serialize the whole table in one pass
+        if pl is not None:
+            try:
+                pl.from_dicts(rows, infer_schema_length=None).write_csv(filepath)
+                logger.info(f"Saved CSV: {filepath}")
+                return str(filepath)
+            except Exception as e:
+                logger.debug(f"polars CSV write failed, using csv module: {e}")
+
+        # Get all unique fields from all records - a set handles the
+        # membership test in O(1) while the list preserves first-seen
+        # column order for the header
+        field_set = set()
         fieldnames = []
-        for record in data:
-            for key in record.keys():
-                if key not in fieldnames:
+        for record in rows:
+            for key in record:
+                if key not in field_set:
+                    field_set.add(key)
                     fieldnames.append(key)
 
-        with open(filepath, "w", encoding="utf-8", newline="") as f:
+        with open(
+            filepath, "w", encoding="utf-8", newline="", buffering=1 << 20
+        ) as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
             writer.writeheader()
+            writer.writerows(rows)
+
+        logger.info(f"Saved CSV: {filepath}")
+        return str(filepath)
+
+    def _write_csv_columns(
+        self,
+        columns: Dict[str, list],
+        filename: str
+    ) -> Optional[str]:
+        """
+        Write a column-oriented dict straight to CSV via polars.
+
+        Args:
+            columns: Mapping of field names to column lists
+            filename: Output filename (without path)
+
+        Returns:
+            Path to the saved file, or None when polars is unavailable
+            or the write fails (callers fall back to the row-wise path)
+        """
+        if pl is None:
+            return None
 
-            for record in data:
-                # Convert list fields to string for CSV
-                row = {}
-                for key, value in record.items():
-                    if isinstance(value, list):
-                        row[key] = "; ".join(str(v) for v in value)
-                    else:
-                        row[key] = value
-                writer.writerow(row)
+        filepath = self.output_dir / filename
+        try:
+            pl.DataFrame(columns).write_csv(filepath)
+        except Exception as e:
+            logger.debug(f"polars columnar CSV write failed: {e}")
+            return None
 
         logger.info(f"Saved CSV: {filepath}")
         return str(filepath)
@@ -94,48 +269,79 @@ class OutputHandler:
         self,
         posts: List[PostData],
         handle: Optional[str] = None,
-        combined: bool = False
+        combined: bool = False,
+        fmt: str = "json"
     ) -> Dict[str, str]:
         """
-        Save posts to both JSON and CSV.
+        Save posts to both JSON and CSV, or to JSON-lines.
 
         Args:
-            posts: List of PostData objects
+            posts: List of PostData objects, or of already-converted
+                dicts (save_all_results passes dicts so each post is
+                only converted once across per-account and combined files)
             handle: Account handle (for per-account files)
             combined: If True, save as combined results files
+            fmt: "json" for indented JSON plus CSV, "jsonl" for a
+                single compact JSON-lines file
 
         Returns:
-            Dictionary with paths to saved files
+            Dictionary with paths to saved files; paths are None
+            when there were no posts to save
         """
-        data = [post.to_dict() for post in posts]
+        data = [
+            post.to_dict() if isinstance(post, PostData) else post
+            for post in posts
+        ]
+
+        # Nothing to write - don't create empty files
+        if not data:
+            return {"json": None, "csv": None}
 
         if combined:
-            json_file = "results.json"
-            csv_file = "results.csv"
+            stem = "results"
         elif handle:
             # Sanitize handle for filename
-            safe_handle = "".join(c for c in handle if c.isalnum() or c in "_-")
-            json_file = f"{safe_handle}.json"
-            csv_file = f"{safe_handle}.csv"
+            stem = _UNSAFE_FILENAME_RE.sub("", handle)
         else:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            json_file = f"posts_{timestamp}.json"
-            csv_file = f"posts_{timestamp}.csv"
+            stem = datetime.now().strftime("posts_%Y%m%d_%H%M%S")
+
+        # JSON-lines fast path: one compact object per line, no
+        # indentation pass and no CSV conversion at all
+        if fmt == "jsonl":
+            return {"jsonl": self.save_jsonl(data, f"{stem}.jsonl")}
+
+        json_file = f"{stem}.json"
+        csv_file = f"{stem}.csv"
+
+        # Columnar fast path: PostData lists convert to a
+        # structure-of-arrays in one pass and skip the row-wise writer
+        csv_path = None
+        if isinstance(posts[0], PostData):
+            csv_path = self._write_csv_columns(
+                PostData.to_columns(posts), csv_file
+            )
 
         return {
             "json": self.save_json(data, json_file),
-            "csv": self.save_csv(data, csv_file)
+            "csv": csv_path or self.save_csv(data, csv_file)
         }
 
     def save_all_results(
         self,
-        posts_by_account: Dict[str, List[PostData]]
+        posts_by_account: Dict[str, List[PostData]],
+        mode: str = "both",
+        fmt: str = "json"
     ) -> Dict[str, Any]:
         """
         Save all results - per-account files and combined files.
 
         Args:
             posts_by_account: Dictionary mapping handles to list of posts
+            mode: "both", "combined", or "per_account" - combined files
+                duplicate every post, so skipping one side halves the
+                serialization and disk bytes
+            fmt: "json" for indented JSON plus CSV per target, "jsonl"
+                for compact JSON-lines files only
 
         Returns:
             Dictionary with all saved file paths
@@ -145,20 +351,36 @@ class OutputHandler:
             "combined": {}
         }
 
-        # Save per-account files
+        # End-of-run files are cumulative: this run's posts merge with
+        # the append-only NDJSON history, so an incremental run that
+        # stopped at last run's newest post still rewrites complete
+        # files instead of shrinking them to the delta. Each post is
+        # converted to a dict exactly once; the combined files reuse
+        # the same dicts
+        dicts_by_account: Dict[str, List[Dict[str, Any]]] = {}
         for handle, posts in posts_by_account.items():
-            if posts:
+            merged: Dict[Any, Dict[str, Any]] = {}
+            for record in self._load_ndjson(handle):
+                merged[record.get("post_id") or id(record)] = record
+            for post in posts:
+                record = post.to_dict() if isinstance(post, PostData) else post
+                merged[record.get("post_id") or id(record)] = record
+            if merged:
+                dicts_by_account[handle] = list(merged.values())
+
+        # Save per-account files
+        if mode != "combined":
+            for handle, data in dicts_by_account.items():
                 saved_files["per_account"][handle] = self.save_posts(
-                    posts, handle=handle
+                    data, handle=handle, fmt=fmt
                 )
 
-        # Combine all posts
-        all_posts = []
-        for posts in posts_by_account.values():
-            all_posts.extend(posts)
-
         # Save combined files
-        if all_posts:
-            saved_files["combined"] = self.save_posts(all_posts, combined=True)
+        if mode != "per_account":
+            all_posts = list(chain.from_iterable(dicts_by_account.values()))
+            if all_posts:
+                saved_files["combined"] = self.save_posts(
+                    all_posts, combined=True, fmt=fmt
+                )
 
         return saved_files
@@ -5,8 +5,11 @@ Handles browser automation, scrolling, retry logic, and orchestration.
 """
 
 import asyncio
+import json
 import random
+import re
 from datetime import datetime
+from pathlib import Path
 from typing import List, Dict, Optional, Set
 from playwright.async_api import (
     async_playwright,
@@ -21,14 +24,73 @@ from .session import SessionManager
 from .extractors import (
     PostData,
     extract_post_data,
+    extract_visible_posts,
     is_post_within_cutoff,
-    SELECTORS
+    SELECTORS_UNIONS
 )
 from .output import OutputHandler
 from .logger import get_logger, ScrapeStats
 
 logger = get_logger()
 
+# Resource types aborted at the route layer when block_resources is on.
+# Media URLs are still extracted from img/video src attributes, which are
+# present in the DOM without downloading the bytes.
+BLOCKED_RESOURCE_TYPES = frozenset({
+    "image",
+    "imageset",
+    "media",
+    "font",
+    "stylesheet",
+    "beacon",
+    "websocket",
+    "texttrack",
+    "csp_report",
+})
+
+
+class _RandomPool:
+    """
+    Buffered random draws for the scroll hot path.
+
+    random.uniform/random.randint pay Random's method dispatch on every
+    call, and they fire on every scroll iteration. Drawing from a
+    pre-generated buffer refilled in one batch keeps the per-call cost
+    to an index increment, and seeding makes run timing reproducible.
+    """
+
+    POOL_SIZE = 4096
+
+    def __init__(self, seed: Optional[int] = None):
+        self._rng = random.Random(seed)
+        self._buffer: List[float] = []
+        self._index = 0
+
+    def _next(self) -> float:
+        """Return the next raw draw in [0.0, 1.0)."""
+        if self._index >= len(self._buffer):
+            self._buffer = [self._rng.random() for _ in range(self.POOL_SIZE)]
+            self._index = 0
+        value = self._buffer[self._index]
+        self._index += 1
+        return value
+
+    def uniform(self, low: float, high: float) -> float:
+        """Return a float in [low, high)."""
+        return low + (high - low) * self._next()
+
+    def randint(self, low: int, high: int) -> int:
+        """Return an integer in [low, high] inclusive."""
+        return low + int((high - low + 1) * self._next())
+
+
+# Rate limit indicators, compiled once - a single case-insensitive scan
+# replaces one substring pass per indicator
+_RATE_LIMIT_RE = re.compile(
+    r"rate limit exceeded|something went wrong|try again|too many requests",
+    re.IGNORECASE
+)
+
 
 class XScraper:
     """Main scraper class for X/Twitter."""
@@ -44,10 +106,45 @@ class XScraper:
         self.session_manager = SessionManager(config.session_file)
         self.output_handler = OutputHandler(config.output_dir)
         self.stats = ScrapeStats()
+        self._random = _RandomPool(config.random_seed)
 
         # Track seen post IDs to avoid duplicates
         self.seen_post_ids: Set[str] = set()
 
+        # Newest post ID per handle from the previous run; lets repeat
+        # runs stop scrolling as soon as they reach known posts
+        self._last_seen: Dict[str, str] = self._load_last_seen()
+
+        # Queue feeding the background NDJSON writer; created by scrape()
+        self._post_queue: Optional[asyncio.Queue] = None
+
+        # Handles that stopped because they reached last run's posts;
+        # zero new posts from these is a success, not a failure
+        self._up_to_date: Set[str] = set()
+
+    def _cache_path(self) -> Path:
+        """Path of the cross-run scrape cache."""
+        return Path(self.config.output_dir) / ".cache.json"
+
+    def _load_last_seen(self) -> Dict[str, str]:
+        """Load the handle -> newest-post-id map from the previous run."""
+        try:
+            return json.loads(self._cache_path().read_bytes())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.debug(f"Could not read scrape cache: {e}")
+            return {}
+
+    def _save_last_seen(self):
+        """Persist the handle -> newest-post-id map for the next run."""
+        try:
+            self._cache_path().write_text(
+                json.dumps(self._last_seen, indent=2), encoding="utf-8"
+            )
+        except Exception as e:
+            logger.debug(f"Could not write scrape cache: {e}")
+
     async def _create_browser_context(
         self,
         browser: Browser
@@ -68,13 +165,29 @@ class XScraper:
             context_options["storage_state"] = session_path
             logger.info("Using saved session state for authentication")
 
-        return await browser.new_context(**context_options)
+        context = await browser.new_context(**context_options)
+
+        if self.config.block_resources:
+            await context.route("**/*", self._block_resources_route)
+            logger.debug(
+                f"Blocking resource types: {', '.join(sorted(BLOCKED_RESOURCE_TYPES))}"
+            )
+
+        return context
+
+    @staticmethod
+    async def _block_resources_route(route):
+        """Abort requests for heavy resource types; let everything else through."""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
 
     async def _random_delay(self, min_delay: float = None, max_delay: float = None):
         """Add a random delay to appear more human-like."""
         min_d = min_delay or self.config.scroll_delay_min
         max_d = max_delay or self.config.scroll_delay_max
-        delay = random.uniform(min_d, max_d)
+        delay = self._random.uniform(min_d, max_d)
         await asyncio.sleep(delay)
 
     async def _scroll_page(self, page: Page) -> int:
@@ -84,7 +197,7 @@ class XScraper:
         Returns:
             Number of pixels scrolled
         """
-        scroll_amount = random.randint(
+        scroll_amount = self._random.randint(
             self.config.scroll_amount_min,
             self.config.scroll_amount_max
         )
@@ -98,26 +211,75 @@ class XScraper:
         Returns:
             True if tweets were found
         """
-        for selector in SELECTORS["tweet_article"]:
-            try:
-                await page.wait_for_selector(
-                    selector,
-                    timeout=self.config.element_timeout
-                )
-                return True
-            except PlaywrightTimeout:
-                continue
+        # One wait on the selector union covers every fallback at once,
+        # instead of burning element_timeout per selector serially
+        try:
+            await page.wait_for_selector(
+                SELECTORS_UNIONS["tweet_article"],
+                timeout=self.config.element_timeout
+            )
+            return True
+        except PlaywrightTimeout:
+            return False
 
-        return False
+    async def _extract_posts_fallback(
+        self,
+        page: Page,
+        handle: str
+    ) -> List[PostData]:
+        """
+        Per-article extraction fallback.
 
-    async def _get_tweet_articles(self, page: Page):
-        """Get all tweet article elements on the page."""
-        for selector in SELECTORS["tweet_article"]:
-            articles = page.locator(selector)
+        Used when the bulk in-page extraction returns nothing - e.g. if a
+        DOM change breaks the batch JS while individual selectors still
+        match. Slower (one evaluation per article) but independent of the
+        bulk path.
+
+        Args:
+            page: Playwright page object
+            handle: Account handle being scraped
+
+        Returns:
+            List of PostData objects
+        """
+        posts: List[PostData] = []
+        try:
+            articles = page.locator(SELECTORS_UNIONS["tweet_article"])
             count = await articles.count()
-            if count > 0:
-                return articles
-        return None
+            scraped_at = datetime.now().isoformat()
+            for i in range(count):
+                post = await extract_post_data(
+                    articles.nth(i), handle, page, scraped_at
+                )
+                if post:
+                    posts.append(post)
+        except Exception as e:
+            logger.debug(f"Fallback extraction failed: {e}")
+        return posts
+
+    @staticmethod
+    async def _page_snippet(page: Page, limit: int = 8192) -> str:
+        """
+        Fetch a bounded slice of the page's rendered text.
+
+        innerText skips markup entirely and the slice caps the transfer,
+        so memory stays bounded no matter how large the DOM grows. Use
+        this instead of page.content() wherever the caller only needs to
+        string-match against visible text.
+
+        Args:
+            page: Playwright page object
+            limit: Maximum characters to transfer
+
+        Returns:
+            Up to ``limit`` characters of visible text ("" on failure)
+        """
+        try:
+            return await page.evaluate(
+                f"() => document.body.innerText.slice(0, {limit})"
+            )
+        except Exception:
+            return ""
 
     async def _handle_rate_limit(
         self,
@@ -130,31 +292,23 @@ class XScraper:
         Returns:
             True if rate limited and should retry
         """
-        # Check for common rate limit indicators
-        rate_limit_indicators = [
-            "Rate limit exceeded",
-            "Something went wrong",
-            "Try again",
-            "too many requests",
-        ]
-
-        page_content = await page.content()
-
-        for indicator in rate_limit_indicators:
-            if indicator.lower() in page_content.lower():
-                delay = self.config.retry_delay * (2 ** attempt)
-                logger.warning(
-                    f"Rate limit detected. Waiting {delay:.1f}s before retry..."
-                )
-                await asyncio.sleep(delay)
-                return True
+        page_text = await self._page_snippet(page, limit=4096)
+
+        if _RATE_LIMIT_RE.search(page_text):
+            delay = self.config.retry_delay * (2 ** attempt)
+            logger.warning(
+                f"Rate limit detected. Waiting {delay:.1f}s before retry..."
+            )
+            await asyncio.sleep(delay)
+            return True
 
         return False
 
     async def _scrape_account(
         self,
         page: Page,
-        handle: str
+        handle: str,
+        cutoff_date: Optional[datetime] = None
     ) -> List[PostData]:
         """
         Scrape posts from a single account.
@@ -162,6 +316,8 @@ class XScraper:
         Args:
             page: Playwright page object
             handle: Account handle to scrape
+            cutoff_date: Cutoff computed once per run; posts older than
+                this stop the scroll
 
         Returns:
             List of PostData objects
@@ -170,7 +326,16 @@ class XScraper:
         account_seen_ids: Set[str] = set()
         no_new_posts_count = 0
         max_no_new_posts = 5  # Stop if we see no new posts after 5 scrolls
-        cutoff_date = self.config.get_cutoff_date()
+        rate_limit_hits = 0  # Consecutive rate-limit signals mid-scroll
+
+        # Snowflake IDs grow monotonically with time, so comparing
+        # against last run's newest ID spots already-scraped posts no
+        # matter where they render - the pinned post comes first in DOM
+        # order but is usually old
+        last_seen_id = self._last_seen.get(handle)
+        last_seen_snowflake = (
+            int(last_seen_id) if last_seen_id and last_seen_id.isdigit() else None
+        )
 
         profile_url = f"https://x.com/{handle}"
         logger.info(f"Scraping @{handle}: {profile_url}")
@@ -192,13 +357,17 @@ class XScraper:
                 if await self._wait_for_tweets(page):
                     break
 
-                # Check if account exists
-                if "This account doesn't exist" in await page.content():
-                    logger.warning(f"Account @{handle} does not exist")
-                    return posts
-
-                if "Account suspended" in await page.content():
-                    logger.warning(f"Account @{handle} is suspended")
+                # Check if account exists - text locators run in the
+                # browser and return a small count, no DOM serialization.
+                # Both error banners share one probe; the common case
+                # (account is fine) pays a single round-trip
+                suspended = page.get_by_text("Account suspended")
+                missing = page.get_by_text("This account doesn't exist")
+                if await missing.or_(suspended).count() > 0:
+                    if await suspended.count() > 0:
+                        logger.warning(f"Account @{handle} is suspended")
+                    else:
+                        logger.warning(f"Account @{handle} does not exist")
                     return posts
 
             except PlaywrightTimeout:
@@ -220,53 +389,80 @@ class XScraper:
 
         # Scroll and collect posts
         while len(posts) < self.config.posts_per_account:
-            articles = await self._get_tweet_articles(page)
+            # One round-trip extracts every visible article
+            batch = await extract_visible_posts(page, handle)
 
-            if not articles:
+            if not batch:
+                # Try the per-article path before giving up, in case the
+                # bulk JS missed something the locators can still read
+                batch = await self._extract_posts_fallback(page, handle)
+
+            if not batch:
                 logger.debug("No tweet articles found on page")
                 break
 
-            article_count = await articles.count()
             new_posts_this_scroll = 0
+            known_posts_this_scroll = 0
 
-            for i in range(article_count):
+            for post in batch:
                 if len(posts) >= self.config.posts_per_account:
                     break
 
-                try:
-                    article = articles.nth(i)
-                    post = await extract_post_data(article, handle, page)
-
-                    if post and post.post_id:
-                        # Skip duplicates
-                        if post.post_id in account_seen_ids:
-                            continue
-
-                        if post.post_id in self.seen_post_ids:
-                            continue
-
-                        # Check date cutoff
-                        if not is_post_within_cutoff(post, cutoff_date):
-                            logger.info(
-                                f"Reached date cutoff for @{handle}. "
-                                f"Collected {len(posts)} posts."
-                            )
-                            return posts
-
-                        account_seen_ids.add(post.post_id)
-                        self.seen_post_ids.add(post.post_id)
-                        posts.append(post)
-                        new_posts_this_scroll += 1
-
-                        logger.debug(
-                            f"Post {len(posts)}/{self.config.posts_per_account}: "
-                            f"{post.post_id}"
-                        )
+                if not post.post_id:
+                    continue
+
+                # Skip duplicates - only the task-local set is consulted
+                # here; the shared seen_post_ids is merged after all
+                # account tasks finish, keeping the hot path lock-free
+                if post.post_id in account_seen_ids:
+                    continue
 
-                except Exception as e:
-                    logger.debug(f"Error extracting post {i}: {e}")
+                # Posts at or below last run's newest snowflake are
+                # already on disk. Don't stop on the first match - that
+                # could be the pinned post - just skip it; the batch
+                # check below stops once a scroll yields only known posts
+                if (
+                    last_seen_snowflake is not None
+                    and post.post_id.isdigit()
+                    and int(post.post_id) <= last_seen_snowflake
+                ):
+                    known_posts_this_scroll += 1
                     continue
 
+                # Check date cutoff
+                if not is_post_within_cutoff(post, cutoff_date):
+                    logger.info(
+                        f"Reached date cutoff for @{handle}. "
+                        f"Collected {len(posts)} posts."
+                    )
+                    return posts
+
+                account_seen_ids.add(post.post_id)
+                posts.append(post)
+                # Hand the post to the background writer so this task
+                # never blocks on disk; fall back to a direct write if
+                # _scrape_account runs outside scrape()
+                if self._post_queue is not None:
+                    self._post_queue.put_nowait((post, handle))
+                else:
+                    self.output_handler.stream_post(post, handle)
+                new_posts_this_scroll += 1
+
+                logger.debug(
+                    f"Post {len(posts)}/{self.config.posts_per_account}: "
+                    f"{post.post_id}"
+                )
+
+            # A scroll that turned up known posts and nothing new means
+            # the rest of the timeline is last run's history
+            if known_posts_this_scroll and new_posts_this_scroll == 0:
+                self._up_to_date.add(handle)
+                logger.info(
+                    f"Reached last run's posts for @{handle}. "
+                    f"Collected {len(posts)} new posts."
+                )
+                return posts
+
             # Check if we're getting new posts
             if new_posts_this_scroll == 0:
                 no_new_posts_count += 1
@@ -283,15 +479,90 @@ class XScraper:
             await self._scroll_page(page)
             await self._random_delay()
 
-            # Check for rate limiting periodically
-            if random.random() < 0.1:  # 10% chance per scroll
-                if await self._handle_rate_limit(page, 0):
-                    await page.reload()
-                    await self._wait_for_tweets(page)
+            # Probe for rate limiting only when the scroll yielded
+            # nothing new - a scroll that produced posts is its own
+            # all-clear, so the probabilistic check just wasted a
+            # round-trip on healthy pages
+            if new_posts_this_scroll == 0:
+                if await self._handle_rate_limit(page, rate_limit_hits):
+                    rate_limit_hits += 1
+                    # _handle_rate_limit already slept with backoff;
+                    # keep scrolling from the current position and only
+                    # reload (discarding the loaded timeline) if the
+                    # signal survives two backoffs
+                    if rate_limit_hits > 2:
+                        await page.reload()
+                        await self._wait_for_tweets(page)
+                        rate_limit_hits = 0
+                else:
+                    rate_limit_hits = 0
 
         logger.info(f"Collected {len(posts)} posts from @{handle}")
         return posts
 
+    async def _scrape_account_task(
+        self,
+        browser: Browser,
+        handle: str,
+        semaphore: asyncio.Semaphore,
+        cutoff_date: Optional[datetime] = None
+    ) -> List[PostData]:
+        """
+        Scrape one account in its own browser context.
+
+        Contexts are cheap to create on a running browser and give each
+        concurrent account isolated cookies, cache, and routing, while
+        still sharing the signed-in storage state.
+
+        Args:
+            browser: Shared browser instance
+            handle: Account handle to scrape
+            semaphore: Limits how many accounts scrape concurrently
+            cutoff_date: Cutoff computed once per run
+
+        Returns:
+            List of PostData objects
+        """
+        async with semaphore:
+            # Stagger start so concurrent accounts don't hit X in lockstep
+            await self._random_delay(0.5, 2.0)
+
+            context = await self._create_browser_context(browser)
+            try:
+                page = await context.new_page()
+                page.set_default_timeout(self.config.page_timeout)
+                return await self._scrape_account(page, handle, cutoff_date)
+            finally:
+                await self._maybe_save_session(context)
+                await context.close()
+
+    async def _drain_post_queue(self, queue: "asyncio.Queue") -> None:
+        """
+        Consume scraped posts and stream them to disk.
+
+        Runs as a background task during scrape(), so file writes
+        overlap the scrape tasks' network waits instead of stalling
+        them. A None sentinel shuts the writer down.
+        """
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            post, handle = item
+            try:
+                self.output_handler.stream_post(post, handle)
+            except Exception as e:
+                logger.debug(f"Error streaming post for @{handle}: {e}")
+
+    async def _maybe_save_session(self, context: BrowserContext):
+        """Persist refreshed session state before a context closes."""
+        if not self.session_manager.has_session():
+            return
+        try:
+            await self.session_manager.save_session(context)
+        except Exception as e:
+            logger.debug(f"Could not update session: {e}")
+
     async def scrape(self) -> Dict[str, List[PostData]]:
         """
         Main scraping method. Scrapes all configured accounts.
@@ -300,6 +571,7 @@ class XScraper:
             Dictionary mapping handles to lists of posts
         """
         self.stats.start()
+        self._up_to_date.clear()
         results: Dict[str, List[PostData]] = {}
 
         if not self.config.accounts:
@@ -308,8 +580,12 @@ class XScraper:
 
         logger.info(f"Starting scrape of {len(self.config.accounts)} accounts")
         logger.info(f"Posts per account: {self.config.posts_per_account}")
+        logger.info(f"Max concurrency: {self.config.max_concurrency}")
         logger.info(f"Headless mode: {self.config.headless}")
 
+        # Compute the cutoff once for the whole run; every account then
+        # filters against the same instant
+        cutoff_date = self.config.get_cutoff_date()
         if self.config.date_cutoff_days:
             logger.info(f"Date cutoff: {self.config.date_cutoff_days} days")
 
@@ -319,41 +595,65 @@ class XScraper:
                 slow_mo=self.config.slow_mo
             )
 
-            context = await self._create_browser_context(browser)
-            page = await context.new_page()
+            # Posts are written by a background task so disk I/O runs
+            # concurrently with scraping
+            self._post_queue = asyncio.Queue()
+            writer = asyncio.create_task(self._drain_post_queue(self._post_queue))
 
-            # Set default timeout
-            page.set_default_timeout(self.config.page_timeout)
-
-            for handle in self.config.accounts:
-                try:
-                    posts = await self._scrape_account(page, handle)
-                    results[handle] = posts
+            try:
+                # One context per account task, bounded by the semaphore
+                semaphore = asyncio.Semaphore(max(1, self.config.max_concurrency))
+                outcomes = await asyncio.gather(
+                    *[
+                        self._scrape_account_task(
+                            browser, handle, semaphore, cutoff_date
+                        )
+                        for handle in self.config.accounts
+                    ],
+                    return_exceptions=True
+                )
 
-                    if posts:
-                        self.stats.add_account_success(handle, len(posts))
-                    else:
-                        self.stats.add_account_failure(handle, "No posts collected")
+                for handle, outcome in zip(self.config.accounts, outcomes):
+                    if isinstance(outcome, BaseException):
+                        logger.error(f"Failed to scrape @{handle}: {outcome}")
+                        self.stats.add_account_failure(handle, str(outcome))
+                        results[handle] = []
+                        continue
 
-                    # Delay between accounts
-                    if handle != self.config.accounts[-1]:
-                        delay = random.uniform(2.0, 4.0)
-                        logger.info(f"Waiting {delay:.1f}s before next account...")
-                        await asyncio.sleep(delay)
+                    results[handle] = outcome
 
-                except Exception as e:
-                    logger.error(f"Failed to scrape @{handle}: {e}")
-                    self.stats.add_account_failure(handle, str(e))
-                    results[handle] = []
+                    # Merge the task-local IDs into the shared set
+                    self.seen_post_ids.update(post.post_id for post in outcome)
 
-            # Save session state if logged in
-            if self.session_manager.has_session():
-                try:
-                    await self.session_manager.save_session(context)
-                except Exception as e:
-                    logger.debug(f"Could not update session: {e}")
+                    if outcome:
+                        self.stats.add_account_success(handle, len(outcome))
+                    elif handle in self._up_to_date:
+                        # Already fully scraped - a clean incremental run
+                        logger.info(f"@{handle} is up to date - no new posts")
+                        self.stats.add_account_success(handle, 0)
+                    else:
+                        self.stats.add_account_failure(handle, "No posts collected")
 
-            await browser.close()
+                # Remember each account's newest post for the next run.
+                # Newest means highest snowflake, not first in DOM order -
+                # a pinned post renders first but can be arbitrarily old
+                for handle, posts in results.items():
+                    ids = [int(p.post_id) for p in posts if p.post_id.isdigit()]
+                    if not ids:
+                        continue
+                    newest = max(ids)
+                    prev = self._last_seen.get(handle)
+                    if prev is None or not prev.isdigit() or int(prev) < newest:
+                        self._last_seen[handle] = str(newest)
+                self._save_last_seen()
+
+            finally:
+                # Flush the writer before closing the streams it feeds
+                await self._post_queue.put(None)
+                await writer
+                self._post_queue = None
+                self.output_handler.close_streams()
+                await browser.close()
 
         self.stats.end()
         return results
@@ -369,7 +669,11 @@ class XScraper:
         results = await self.scrape()
 
         # Save outputs
-        saved_files = self.output_handler.save_all_results(results)
+        saved_files = self.output_handler.save_all_results(
+            results,
+            mode=self.config.output_mode,
+            fmt=self.config.output_format
+        )
 
         # Print summary
         self.stats.print_summary(logger)
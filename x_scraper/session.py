@@ -5,6 +5,7 @@ This module handles Playwright storage state for maintaining login sessions.
 Never stores credentials directly - only browser state.
 """
 
+import hashlib
 import json
 from pathlib import Path
 from typing import Optional
@@ -14,6 +15,19 @@ from .logger import get_logger
 
 logger = get_logger()
 
+# orjson serializes the storage state several times faster than stdlib
+# json; fall back to stdlib if it isn't installed. Keys are sorted so
+# the same state always produces the same bytes (and the same hash)
+try:
+    import orjson
+
+    def _dumps_sorted(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+
+except ImportError:
+    def _dumps_sorted(obj) -> bytes:
+        return json.dumps(obj, sort_keys=True).encode("utf-8")
+
 
 class SessionManager:
     """Manage browser session state for authenticated scraping."""
@@ -29,6 +43,10 @@ class SessionManager:
         """
         self.session_file = Path(session_file or self.DEFAULT_SESSION_PATH)
 
+        # Hash of the last state written to disk; loaded lazily from the
+        # sidecar so unchanged sessions skip the write across runs too
+        self._last_hash: Optional[str] = None
+
     def has_session(self) -> bool:
         """Check if a saved session exists."""
         return self.session_file.exists()
@@ -37,21 +55,53 @@ class SessionManager:
         """Get the absolute path to the session file."""
         return str(self.session_file.absolute())
 
+    def _hash_path(self) -> Path:
+        """Path of the sidecar file recording the saved state's hash."""
+        return self.session_file.with_suffix(self.session_file.suffix + ".hash")
+
+    def _read_saved_hash(self) -> Optional[str]:
+        """Read the hash of the state currently on disk, if any."""
+        try:
+            return self._hash_path().read_text().strip() or None
+        except OSError:
+            return None
+
     def delete_session(self):
         """Delete the saved session file."""
         if self.session_file.exists():
             self.session_file.unlink()
             logger.info(f"Deleted session file: {self.session_file}")
+        self._hash_path().unlink(missing_ok=True)
+        self._last_hash = None
 
     async def save_session(self, context: BrowserContext):
         """
         Save the current browser context's storage state.
 
+        The state is fetched as a dict, serialized once with sorted
+        keys, and hashed; if it matches what's already on disk the
+        write is skipped entirely. With per-account contexts closing
+        after every task, this turns the common "nothing changed" case
+        into a hash comparison instead of rewriting the cookie blob.
+
         Args:
             context: Playwright browser context to save
         """
+        state = await context.storage_state()
+        payload = _dumps_sorted(state)
+        digest = hashlib.sha256(payload).hexdigest()
+
+        if self._last_hash is None:
+            self._last_hash = self._read_saved_hash()
+
+        if digest == self._last_hash and self.session_file.exists():
+            logger.debug("Session state unchanged - skipping save")
+            return
+
         self.session_file.parent.mkdir(parents=True, exist_ok=True)
-        await context.storage_state(path=str(self.session_file))
+        self.session_file.write_bytes(payload)
+        self._hash_path().write_text(digest)
+        self._last_hash = digest
         logger.info(f"Session saved to: {self.session_file}")
 
     def get_storage_state_for_context(self) -> Optional[str]: